@@ -2,12 +2,58 @@ import asyncio
 
 import httpx
 from src.config import GitHubConfig, LLMConfig, get_github_config, get_llm_config
-from src.crew import run_algorithm_review
 from src.github_service import get_commit_data, get_readme_content, write_comment_in_commit
 from src.logger import logger
 from src.scrapers.factory import get_scraper
+from src.scrapers.models import ProblemData
 from src.utils import parse_problem_url, parse_readme_as_problem
 
+# 공급자 측 속도 제한(rate limit)을 넘지 않도록 동시에 실행하는 AI 리뷰 수를 제한합니다.
+MAX_CONCURRENT_REVIEWS = 4
+
+# 같은 문제를 여러 언어로 푼 경우 문제 정보를 한 번만 스크래핑하도록 작업을 공유합니다.
+_problem_tasks: dict[tuple[str, str], asyncio.Future] = {}
+
+
+async def get_problem_data(
+    platform: str, problem_id: str, client: httpx.AsyncClient
+) -> ProblemData:
+    """(플랫폼, 문제 ID)별로 스크래핑을 한 번만 수행하고 결과를 공유합니다."""
+    key = (platform, problem_id)
+    task = _problem_tasks.get(key)
+    if task is None:
+        scraper = get_scraper(platform, client)
+        task = asyncio.ensure_future(scraper.get_problem(problem_id))
+        _problem_tasks[key] = task
+    return await task
+
+
+def format_problem_info(
+    title: str,
+    platform: str,
+    url: str,
+    description: str,
+    input_desc: str,
+    output_desc: str,
+    meta: dict[str, str] | None = None,
+) -> str:
+    """리뷰 프롬프트에 넣을 문제 정보 문자열을 만듭니다."""
+    lines = [f"Title: {title}", f"Platform: {platform}", f"URL: {url}"]
+    if meta:
+        lines.extend(f"{key}: {value}" for key, value in meta.items())
+    lines += [
+        "",
+        "[Description]",
+        description,
+        "",
+        "[Input Description]",
+        input_desc,
+        "",
+        "[Output Description]",
+        output_desc,
+    ]
+    return "\n".join(lines)
+
 
 async def process_file(
     filename: str,
@@ -15,6 +61,7 @@ async def process_file(
     llm_config: LLMConfig,
     client: httpx.AsyncClient,
     github_config: GitHubConfig,
+    review_semaphore: asyncio.Semaphore,
 ) -> str | None:
     """
     단일 파일을 처리하여 리뷰 결과를 반환합니다.
@@ -23,80 +70,73 @@ async def process_file(
     """
     parsed = parse_problem_url(content)
     if not parsed:
-        logger.info(f"Skipping {filename}: No supported problem URL found.")
+        logger.info("Skipping %s: No supported problem URL found.", filename)
         return None
 
     platform, problem_id = parsed
-    logger.info(f"Detected {platform} problem {problem_id} in {filename}")
+    logger.info("Detected %s problem %s in %s", platform, problem_id, filename)
 
     problem_info_str = None
 
     # 1차: 스크래핑 시도
     try:
-        scraper = get_scraper(platform, client)
-        problem_data = await scraper.get_problem(problem_id)
-
-        problem_info_str = f"""
-    Title: {problem_data.title}
-    Platform: {problem_data.platform}
-    URL: {problem_data.url}
-    
-    [Description]
-    {problem_data.description}
-    
-    [Input Description]
-    {problem_data.input_desc}
-    
-    [Output Description]
-    {problem_data.output_desc}
-    """
+        problem_data = await get_problem_data(platform, problem_id, client)
+
+        problem_info_str = format_problem_info(
+            title=problem_data.title,
+            platform=problem_data.platform,
+            url=problem_data.url,
+            description=problem_data.description,
+            input_desc=problem_data.input_desc,
+            output_desc=problem_data.output_desc,
+        )
     except Exception as e:
-        logger.warning(f"스크래핑 실패 ({filename}): {e}")
+        logger.warning("스크래핑 실패 (%s): %s", filename, e)
         logger.info("README.md fallback 시도 중...")
 
         # 2차: README.md fallback
-        readme_content = get_readme_content(github_config, filename)
+        readme_content = await get_readme_content(github_config, client, filename)
         if readme_content:
             readme_info = parse_readme_as_problem(readme_content)
             if readme_info:
-                logger.info(f"README.md에서 문제 정보 로드 성공: {readme_info.title}")
-                problem_info_str = f"""
-    Title: {readme_info.title}
-    Platform: {platform}
-    URL: {readme_info.url}
-    Difficulty: {readme_info.difficulty or 'N/A'}
-    Tags: {', '.join(readme_info.tags) if readme_info.tags else 'N/A'}
-    
-    [Description]
-    {readme_info.description}
-    
-    [Input Description]
-    {readme_info.input_desc}
-    
-    [Output Description]
-    {readme_info.output_desc}
-    """
+                logger.info("README.md에서 문제 정보 로드 성공: %s", readme_info.title)
+                problem_info_str = format_problem_info(
+                    title=readme_info.title,
+                    platform=platform,
+                    url=readme_info.url,
+                    description=readme_info.description,
+                    input_desc=readme_info.input_desc,
+                    output_desc=readme_info.output_desc,
+                    meta={
+                        "Difficulty": readme_info.difficulty or "N/A",
+                        "Tags": ", ".join(readme_info.tags) if readme_info.tags else "N/A",
+                    },
+                )
             else:
                 logger.warning("README.md 파싱 실패: 유효한 문제 정보가 없습니다.")
         else:
-            logger.warning(f"README.md를 찾을 수 없습니다: {filename}")
+            logger.warning("README.md를 찾을 수 없습니다: %s", filename)
 
     if not problem_info_str:
-        logger.error(f"문제 정보를 가져올 수 없습니다: {filename}")
+        logger.error("문제 정보를 가져올 수 없습니다: %s", filename)
         return None
 
+    # crewai(및 LiteLLM)는 임포트 비용이 크므로, 실제로 리뷰할 파일이 있을 때만 불러옵니다.
+    from src.crew import run_algorithm_review
+
     # 동기 함수인 CrewAI 실행을 비동기 환경에서 실행 (블로킹 방지)
     # CrewAI 내부적으로 API 호출 등을 하므로 시간이 걸림
     try:
-        review = await asyncio.to_thread(
-            run_algorithm_review,
-            problem_info=problem_info_str,
-            solution_code=content,
-            llm_config=llm_config,
-        )
+        async with review_semaphore:
+            review = await asyncio.to_thread(
+                run_algorithm_review,
+                problem_info=problem_info_str,
+                solution_code=content,
+                llm_config=llm_config,
+            )
         return f"## 🧐 Review for `{filename}`\n\n{review}"
     except Exception as e:
-        logger.error(f"Error running review for {filename}: {e}")
+        logger.error("Error running review for %s: %s", filename, e)
         return None
 
 
@@ -105,42 +145,51 @@ async def main_async():
         github_config = get_github_config()
         llm_config = get_llm_config()
     except Exception as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         return
 
-    logger.info(f"Processing commit: {github_config.commit_sha}")
+    logger.info("Processing commit: %s", github_config.commit_sha)
 
-    # 1. 커밋된 파일 가져오기
-    try:
-        commit_data = get_commit_data(github_config)
-    except Exception as e:
-        logger.error(f"Error fetching commit data: {e}")
-        return
+    # GitHub API와 스크래퍼가 하나의 HTTP/2 커넥션 풀을 공유합니다.
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    ) as client:
+        # 1. 커밋된 파일 가져오기
+        try:
+            commit_data = await get_commit_data(github_config, client)
+        except Exception as e:
+            logger.error("Error fetching commit data: %s", e)
+            return
 
-    if not commit_data:
-        logger.info("No supported files found in this commit.")
-        return
+        if not commit_data:
+            logger.info("No supported files found in this commit.")
+            return
 
-    reviews = []
-    async with httpx.AsyncClient() as client:
+        review_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REVIEWS)
         tasks = []
         for filename, content in commit_data.items():
-            tasks.append(process_file(filename, content, llm_config, client, github_config))
+            tasks.append(
+                process_file(
+                    filename, content, llm_config, client, github_config, review_semaphore
+                )
+            )
 
         # 병렬 처리
         results = await asyncio.gather(*tasks)
         reviews = [r for r in results if r]
 
-    # 2. 리뷰 결과 코멘트로 등록
-    if reviews:
-        final_comment = "\n\n---\n\n".join(reviews)
-        try:
-            write_comment_in_commit(github_config, final_comment)
-            logger.info("Successfully posted reviews.")
-        except Exception as e:
-            logger.error(f"Error posting comment: {e}")
-    else:
-        logger.info("No reviews generated.")
+        # 2. 리뷰 결과 코멘트로 등록
+        if reviews:
+            final_comment = "\n\n---\n\n".join(reviews)
+            try:
+                await write_comment_in_commit(github_config, client, final_comment)
+                logger.info("Successfully posted reviews.")
+            except Exception as e:
+                logger.error("Error posting comment: %s", e)
+        else:
+            logger.info("No reviews generated.")
 
 
 def main():
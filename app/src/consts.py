@@ -1,6 +1,6 @@
 from enum import Enum
 
-SUPPORT_FILE_EXTENSIONS: tuple = (
+SUPPORT_FILE_EXTENSIONS: tuple[str, ...] = (
     ".c",
     ".cpp",
     ".cc",
@@ -48,3 +48,11 @@ API_KEY_ENV_MAP: dict[LLMProvider, str] = {
     LLMProvider.ANTHROPIC: "ANTHROPIC_API_KEY",
     LLMProvider.GOOGLE: "GEMINI_API_KEY",
 }
+
+# LiteLLM 모델 이름 접두사 (provider/model_name)
+# OpenAI는 접두사 없이도 동작하므로 사용자가 입력한 모델명을 그대로 사용합니다.
+LITELLM_MODEL_PREFIX_MAP: dict[LLMProvider, str] = {
+    LLMProvider.OPENAI: "",
+    LLMProvider.ANTHROPIC: "anthropic/",
+    LLMProvider.GOOGLE: "gemini/",
+}
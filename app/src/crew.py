@@ -1,29 +1,65 @@
+from functools import lru_cache
 from textwrap import dedent
 
 from crewai import LLM, Agent, Crew, Process, Task
 
 from .config import LLMConfig
-from .consts import LLMProvider
-
-
+from .consts import LITELLM_MODEL_PREFIX_MAP
+
+# 리뷰어 Agent 배경 설명 (호출마다 바뀌지 않으므로 모듈 로드 시 한 번만 만듭니다)
+_REVIEWER_BACKSTORY = dedent("""
+    You are a Senior Algorithm Expert with deep knowledge in competitive programming and software engineering.
+    You verify correctness like a strict Online Judge, analyze complexity like an optimization guru,
+    and ensure clean, readable code like a seasoned mentor.
+""")
+
+# 코드 리뷰 Task 기대 결과물
+_REVIEW_EXPECTED_OUTPUT = dedent("""
+    A final Markdown report containing:
+    1. 📋 Problem Analysis Summary
+    2. ✅ Correctness Verification
+    3. ⚡ Performance Analysis
+    4. 🎯 Improvement Suggestions (Refactoring, Optimization)
+    5. 📚 Study Guide (Related concepts)
+""")
+
+# 코드 리뷰 Task 설명 템플릿
+# 들여쓰기는 모듈 로드 시 한 번만 제거해 두고, 호출마다 값만 채워 넣습니다.
+# (풀이 코드를 넣은 뒤 dedent하면 매번 코드 전체를 훑고, 들여쓰기 없는
+# 코드 줄 때문에 템플릿의 들여쓰기가 제거되지 않는 문제도 있습니다.)
+_REVIEW_TASK_TEMPLATE = dedent("""
+    Analyze the provided solution code for the given problem.
+    
+    [Problem Info]
+    {problem_info}
+
+    [Solution Code]
+    {solution_code}
+
+    Review the code from these perspectives:
+    1. Correctness: Logic, edge cases, boundary conditions
+    2. Performance: Time/Space complexity, optimizations
+    3. Code Quality: Readability, naming, best practices
+
+    Create a comprehensive Markdown report in {response_language}.
+    The report should be encouraging but technically rigorous.
+""")
+
+
+@lru_cache(maxsize=8)
 def get_crewai_llm(llm_config: LLMConfig) -> LLM:
     """
     config.py 설정을 기반으로 CrewAI의 LLM 객체(LiteLLM 기반)를 반환합니다.
     LiteLLM은 공급자(Provider)에 따라 모델명에 접두사가 필요할 수 있습니다.
+    LLMConfig는 frozen dataclass라 해시 가능하므로, 같은 설정이면 파일마다
+    LLM 객체를 새로 만들지 않고 캐시된 인스턴스를 재사용합니다.
     """
     model_name = llm_config.model_name
 
     # LiteLLM 모델 이름 규칙 적용 (provider/model_name)
-    if llm_config.provider == LLMProvider.ANTHROPIC:
-        if not model_name.startswith("anthropic/"):
-            model_name = f"anthropic/{model_name}"
-    elif llm_config.provider == LLMProvider.GOOGLE:
-        if not model_name.startswith("gemini/"):
-            model_name = f"gemini/{model_name}"
-    elif llm_config.provider == LLMProvider.OPENAI:
-        # OpenAI는 접두사 없이도 동작하지만, 명시적으로 openai/를 붙일 수 있습니다.
-        # 여기서는 사용자가 환경 변수에 입력한 모델명을 우선합니다.
-        pass
+    prefix = LITELLM_MODEL_PREFIX_MAP[llm_config.provider]
+    if prefix and not model_name.startswith(prefix):
+        model_name = f"{prefix}{model_name}"
 
     # CrewAI의 LLM 클래스는 LiteLLM을 사용하여 모델을 호출합니다.
     # API 키는 환경 변수(OPENAI_API_KEY, ANTHROPIC_API_KEY 등)에서 자동으로 로드됩니다.
@@ -41,11 +77,7 @@ class AlgorithmReviewCrew:
         return Agent(
             role="Algorithm Review Expert",
             goal="Provide comprehensive code review covering correctness, performance, and code quality.",
-            backstory=dedent("""
-                You are a Senior Algorithm Expert with deep knowledge in competitive programming and software engineering.
-                You verify correctness like a strict Online Judge, analyze complexity like an optimization guru,
-                and ensure clean, readable code like a seasoned mentor.
-            """),
+            backstory=_REVIEWER_BACKSTORY,
             llm=self.llm,
             verbose=True,
             allow_delegation=False,
@@ -53,31 +85,12 @@ class AlgorithmReviewCrew:
 
     def review_task(self, agent: Agent) -> Task:
         return Task(
-            description=dedent(f"""
-                Analyze the provided solution code for the given problem.
-                
-                [Problem Info]
-                {self.problem_info}
-
-                [Solution Code]
-                {self.solution_code}
-
-                Review the code from these perspectives:
-                1. Correctness: Logic, edge cases, boundary conditions
-                2. Performance: Time/Space complexity, optimizations
-                3. Code Quality: Readability, naming, best practices
-
-                Create a comprehensive Markdown report in {self.llm_config.response_language}.
-                The report should be encouraging but technically rigorous.
-            """),
-            expected_output=dedent("""
-                A final Markdown report containing:
-                1. 📋 Problem Analysis Summary
-                2. ✅ Correctness Verification
-                3. ⚡ Performance Analysis
-                4. 🎯 Improvement Suggestions (Refactoring, Optimization)
-                5. 📚 Study Guide (Related concepts)
-            """),
+            description=_REVIEW_TASK_TEMPLATE.format(
+                problem_info=self.problem_info,
+                solution_code=self.solution_code,
+                response_language=self.llm_config.response_language,
+            ),
+            expected_output=_REVIEW_EXPECTED_OUTPUT,
             agent=agent,
         )
 
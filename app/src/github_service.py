@@ -1,69 +1,317 @@
+import asyncio
 import json
 import os
+import re
 
 import httpx
 
 from .config import GitHubConfig
 from .consts import COMMENT_PREFIX_MAP, SUPPORT_FILE_EXTENSIONS
+from .http_retry import get_retry_delay
+from .logger import logger
 
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 
-def get_commit_data(config: GitHubConfig) -> dict:
-    headers = {
+# GitHub 보조 레이트 리밋(secondary rate limit)을 피하기 위한 최대 동시 요청 수
+MAX_CONCURRENT_REQUESTS = 8
+
+# 레이트 리밋 응답 시 재시도 설정
+MAX_RETRY_ATTEMPTS = 5
+# 조회(GET) 요청은 일시적인 서버 오류에도 재시도합니다.
+RETRYABLE_SERVER_ERRORS = frozenset({500, 502, 503, 504})
+
+# 스트리밍 조회 시 첫 줄 판별을 위해 먼저 읽는 최대 바이트 수
+FIRST_LINE_PEEK_BYTES = 4096
+
+_LEADING_WHITESPACE_RE = re.compile(r"\s*")
+
+# 확장자 필터는 파일마다 수행되므로 O(1) 집합 조회로 미리 만들어 둡니다.
+_SUPPORTED_SUFFIX_SET: frozenset[str] = frozenset(
+    ext.lower() for ext in SUPPORT_FILE_EXTENSIONS
+)
+
+# (repository, commit_sha, 디렉토리) 별 README 조회 태스크
+_readme_tasks: dict[tuple[str, str, str], asyncio.Future] = {}
+
+
+def _github_headers(config: GitHubConfig, accept: str) -> dict[str, str]:
+    # 클라이언트는 스크래퍼와 공유하므로 토큰은 GitHub 요청에만 개별로 붙입니다.
+    return {
         "Authorization": f"token {config.github_token}",
-        "Accept": "application/vnd.github.v3.json",
+        "Accept": accept,
     }
+
+
+async def get_commit_data(config: GitHubConfig, client: httpx.AsyncClient) -> dict:
+    headers = _github_headers(config, "application/vnd.github.v3.json")
     url = (
         f"https://api.github.com/repos/{config.repository}/commits/{config.commit_sha}"
     )
-    response = httpx.get(url, headers=headers)
-    file_contents = {}
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    response = await _bounded_get(client, semaphore, url, headers=headers)
     commit_data = response.json()
     files = commit_data["files"]
+
+    # 확장자로 먼저 거른 뒤, 남은 파일만 내용을 가져옵니다.
+    targets = []
     for file in files:
-        filename = file["filename"]
-        if not filename.endswith(SUPPORT_FILE_EXTENSIONS):
+        # 삭제된 파일은 내용 조회가 항상 404이므로 요청하지 않습니다.
+        if file.get("status") == "removed":
             continue
 
-        url = f"https://api.github.com/repos/{config.repository}/contents/{filename}"
-        # Use raw header for file content to get the actual text
-        content_headers = headers.copy()
-        content_headers["Accept"] = "application/vnd.github.v3.raw"
-        response = httpx.get(url, headers=content_headers)
-        content = response.text
-
-        # Check if the first line is a comment
+        filename = file["filename"]
         _, ext = os.path.splitext(filename)
-        prefixes = COMMENT_PREFIX_MAP.get(ext, ())
+        ext = ext.lower()
+        if ext not in _SUPPORTED_SUFFIX_SET:
+            continue
+        targets.append((filename, ext))
 
-        # Skip if no comment prefixes defined or file is empty
-        if not prefixes or not content.strip():
+    filenames = [filename for filename, _ in targets]
+    contents = await _fetch_contents_via_graphql(config, client, filenames)
+    # GraphQL로 받지 못한 파일만 REST API로 개별 조회합니다.
+    missing = [target for target in targets if target[0] not in contents]
+    if missing:
+        contents.update(
+            await _fetch_contents_via_rest(config, client, semaphore, missing)
+        )
+
+    file_contents = {}
+    for filename, ext in targets:
+        content = contents.get(filename)
+        if content is None:
             continue
 
-        first_line = content.lstrip().split("\n", 1)[0].strip()
-        if not any(first_line.startswith(p) for p in prefixes):
+        # Check if the first line is a comment
+        if not _has_comment_header(content, COMMENT_PREFIX_MAP.get(ext, ())):
             continue
 
         file_contents[filename] = content
     return file_contents
 
 
-def write_comment_in_commit(config: GitHubConfig, comment: str) -> None:
+def _has_comment_header(content: str, prefixes: tuple[str, ...]) -> bool:
+    """파일의 첫 줄(앞쪽 공백 제외)이 주석으로 시작하는지 확인합니다."""
+    # 파일 전체를 lstrip/split하지 않고 첫 글자 위치만 찾아 그 자리에서 비교합니다.
+    start = _LEADING_WHITESPACE_RE.match(content).end()
+
+    # Skip if no comment prefixes defined or file is empty
+    if not prefixes or start == len(content):
+        return False
+
+    # str.startswith는 튜플을 직접 받아 C 레벨에서 한 번에 비교합니다.
+    return content.startswith(prefixes, start)
+
+
+async def _fetch_contents_via_graphql(
+    config: GitHubConfig, client: httpx.AsyncClient, filenames: list[str]
+) -> dict[str, str]:
+    """
+    GraphQL 요청 한 번으로 커밋 시점의 여러 파일 내용을 가져옵니다.
+    요청이 실패하면 빈 dict를 반환하고, 호출 측은 REST 개별 조회로 대체합니다.
+    바이너리이거나 크기가 커서 일부만 내려온(isTruncated) 파일은 결과에서 빠지며,
+    호출 측에서 REST 스트리밍 조회로 전체 내용을 받습니다.
+    """
+    if not filenames:
+        return {}
+
+    owner, _, name = config.repository.partition("/")
+    variable_defs = "".join(f", $e{i}: String!" for i in range(len(filenames)))
+    fields = " ".join(
+        f"f{i}: object(expression: $e{i}) "
+        "{ ... on Blob { text isBinary isTruncated } }"
+        for i in range(len(filenames))
+    )
+    query = (
+        f"query($owner: String!, $name: String!{variable_defs}) "
+        f"{{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+    )
+    variables = {"owner": owner, "name": name}
+    for i, filename in enumerate(filenames):
+        variables[f"e{i}"] = f"{config.commit_sha}:{filename}"
+
+    try:
+        response = await _request_with_backoff(
+            client,
+            "POST",
+            GITHUB_GRAPHQL_URL,
+            retry_server_errors=True,
+            headers=_github_headers(config, "application/json"),
+            json={"query": query, "variables": variables},
+        )
+        response.raise_for_status()
+        payload = response.json()
+    except Exception as e:
+        logger.warning("GraphQL 파일 조회 실패, REST API로 대체합니다: %s", e)
+        return {}
+
+    # 일부 파일에 오류가 있어도 받은 데이터는 그대로 사용합니다.
+    repository = (payload.get("data") or {}).get("repository") or {}
+    contents = {}
+    for i, filename in enumerate(filenames):
+        blob = repository.get(f"f{i}")
+        if (
+            not blob
+            or blob.get("text") is None
+            or blob.get("isBinary")
+            or blob.get("isTruncated")
+        ):
+            continue
+        contents[filename] = blob["text"]
+    return contents
+
+
+async def _fetch_contents_via_rest(
+    config: GitHubConfig,
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    targets: list[tuple[str, str]],
+) -> dict[str, str]:
+    """contents API로 (파일명, 확장자) 목록의 내용을 동시에 하나씩 조회합니다."""
+    # Use raw header for file content to get the actual text
+    headers = _github_headers(config, "application/vnd.github.raw")
+    # 기본 브랜치가 아니라 리뷰 대상 커밋 시점의 내용을 가져옵니다.
+    params = {"ref": config.commit_sha}
+
+    results = await asyncio.gather(
+        *(
+            _fetch_commented_file(
+                client,
+                semaphore,
+                f"https://api.github.com/repos/{config.repository}/contents/{filename}",
+                COMMENT_PREFIX_MAP.get(ext, ()),
+                headers=headers,
+                params=params,
+            )
+            for filename, ext in targets
+        ),
+        return_exceptions=True,
+    )
+
+    contents = {}
+    for (filename, _), result in zip(targets, results):
+        if isinstance(result, Exception):
+            logger.warning("파일 내용을 가져오지 못했습니다: %s", filename)
+            continue
+        if result is not None:
+            contents[filename] = result
+    return contents
+
+
+async def _fetch_commented_file(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    url: str,
+    prefixes: tuple[str, ...],
+    **kwargs,
+) -> str | None:
+    """
+    파일을 스트리밍으로 받으면서 첫 줄만 먼저 확인합니다.
+    첫 줄이 주석이 아니면 나머지 본문은 받지 않고 None을 반환합니다.
+    """
+    async with semaphore:
+        for attempt in range(MAX_RETRY_ATTEMPTS):
+            async with client.stream("GET", url, **kwargs) as response:
+                retryable = (
+                    _is_rate_limited(response)
+                    or response.status_code in RETRYABLE_SERVER_ERRORS
+                )
+                if retryable and attempt < MAX_RETRY_ATTEMPTS - 1:
+                    delay = get_retry_delay(response, attempt)
+                else:
+                    response.raise_for_status()
+                    encoding = response.encoding or "utf-8"
+
+                    body = bytearray()
+                    chunks = response.aiter_bytes()
+                    # 첫 줄이 끝나거나 FIRST_LINE_PEEK_BYTES를 넘을 때까지만 읽습니다.
+                    async for chunk in chunks:
+                        body += chunk
+                        if (
+                            b"\n" in body.lstrip()
+                            or len(body) >= FIRST_LINE_PEEK_BYTES
+                        ):
+                            break
+
+                    head = body.decode(encoding, errors="ignore")
+                    if not _has_comment_header(head, prefixes):
+                        return None
+
+                    async for chunk in chunks:
+                        body += chunk
+                    return body.decode(encoding, errors="replace")
+            await asyncio.sleep(delay)
+    return None
+
+
+def _is_rate_limited(response: httpx.Response) -> bool:
+    if response.status_code == 429:
+        return True
+    # GitHub은 레이트 리밋 초과 시 403과 함께 아래 헤더를 내려줍니다.
+    return response.status_code == 403 and (
+        "Retry-After" in response.headers
+        or response.headers.get("X-RateLimit-Remaining") == "0"
+    )
+
+
+async def _request_with_backoff(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    retry_server_errors: bool = False,
+    **kwargs,
+) -> httpx.Response:
+    """
+    레이트 리밋(403/429)에 걸리면 대기 후 최대 MAX_RETRY_ATTEMPTS번 재시도합니다.
+    retry_server_errors가 True이면 일시적인 서버 오류(5xx)도 재시도합니다.
+    """
+    for attempt in range(MAX_RETRY_ATTEMPTS):
+        response = await client.request(method, url, **kwargs)
+        retryable = _is_rate_limited(response) or (
+            retry_server_errors and response.status_code in RETRYABLE_SERVER_ERRORS
+        )
+        if not retryable or attempt == MAX_RETRY_ATTEMPTS - 1:
+            break
+        await asyncio.sleep(get_retry_delay(response, attempt))
+    return response
+
+
+async def _bounded_get(
+    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str, **kwargs
+) -> httpx.Response:
+    """동시 요청 수를 semaphore로 제한한 GET 요청 (5xx 포함 재시도)"""
+    async with semaphore:
+        return await _request_with_backoff(
+            client, "GET", url, retry_server_errors=True, **kwargs
+        )
+
+
+async def write_comment_in_commit(
+    config: GitHubConfig, client: httpx.AsyncClient, comment: str
+) -> None:
     url = f"https://api.github.com/repos/{config.repository}/commits/{config.commit_sha}/comments"
-    headers = {
-        "Authorization": f"token {config.github_token}",
-        "Accept": "application/vnd.github.v3+json",
-    }
+    headers = _github_headers(config, "application/vnd.github+json")
+    headers["Content-Type"] = "application/json; charset=utf-8"
     data = {"body": comment}
+    # 리뷰 본문은 한글/이모지가 많으므로 \uXXXX 이스케이프 없이 UTF-8로 그대로 보냅니다.
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
-    response = httpx.post(url, headers=headers, data=json.dumps(data))
+    response = await _request_with_backoff(
+        client, "POST", url, headers=headers, content=body
+    )
+    response.raise_for_status()
 
 
-def get_readme_content(config: GitHubConfig, file_path: str) -> str | None:
+async def get_readme_content(
+    config: GitHubConfig, client: httpx.AsyncClient, file_path: str
+) -> str | None:
     """
     리뷰 대상 파일과 같은 디렉토리의 README.md 파일 내용을 가져옵니다.
+    같은 디렉토리의 여러 파일이 동시에 요청해도 README는 한 번만 조회합니다.
 
     Args:
         config: GitHub 설정
+        client: 공유 HTTP 클라이언트
         file_path: 리뷰 대상 파일 경로 (예: "solutions/boj/1000/solution.py")
 
     Returns:
@@ -71,18 +319,46 @@ def get_readme_content(config: GitHubConfig, file_path: str) -> str | None:
     """
     # 파일 경로에서 디렉토리 추출
     dir_path = os.path.dirname(file_path)
-    readme_path = os.path.join(dir_path, "README.md").replace("\\", "/")
 
-    headers = {
-        "Authorization": f"token {config.github_token}",
-        "Accept": "application/vnd.github.v3.raw",
-    }
-    url = f"https://api.github.com/repos/{config.repository}/contents/{readme_path}"
+    # 커밋 SHA까지 키에 포함해 다른 커밋의 README와 섞이지 않게 합니다.
+    key = (config.repository, config.commit_sha, dir_path)
+    task = _readme_tasks.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_readme(config, client, dir_path))
+        _readme_tasks[key] = task
+        # 실패한 조회는 캐시에 남기지 않아 다음 요청에서 다시 시도합니다.
+        task.add_done_callback(lambda done: _drop_failed_readme_task(key, done))
 
     try:
-        response = httpx.get(url, headers=headers)
-        if response.status_code == 200:
-            return response.text
-        return None
+        return await task
     except Exception:
         return None
+
+
+def _drop_failed_readme_task(
+    key: tuple[str, str, str], task: asyncio.Future
+) -> None:
+    failed = task.cancelled() or task.exception() is not None
+    if failed and _readme_tasks.get(key) is task:
+        del _readme_tasks[key]
+
+
+async def _fetch_readme(
+    config: GitHubConfig, client: httpx.AsyncClient, dir_path: str
+) -> str | None:
+    readme_path = os.path.join(dir_path, "README.md").replace("\\", "/")
+
+    headers = _github_headers(config, "application/vnd.github.raw")
+    url = f"https://api.github.com/repos/{config.repository}/contents/{readme_path}"
+
+    response = await _request_with_backoff(
+        client,
+        "GET",
+        url,
+        retry_server_errors=True,
+        headers=headers,
+        params={"ref": config.commit_sha},
+    )
+    if response.status_code == 200:
+        return response.text
+    return None
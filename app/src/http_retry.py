@@ -0,0 +1,25 @@
+import random
+import time
+
+import httpx
+
+# 재시도 대기 시간 상한 (초)
+MAX_RETRY_DELAY = 30.0
+
+
+def get_retry_delay(response: httpx.Response | None, attempt: int) -> float:
+    """
+    서버가 알려준 대기 시간(Retry-After, X-RateLimit-Reset)을 우선 사용하고,
+    없으면 지수 백오프 + 지터로 대기 시간을 계산합니다.
+    응답 없이 실패한 경우(네트워크 에러 등)에는 response로 None을 넘깁니다.
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), MAX_RETRY_DELAY)
+
+        reset_at = response.headers.get("X-RateLimit-Reset")
+        if reset_at and reset_at.isdigit():
+            return min(max(int(reset_at) - time.time(), 0.0), MAX_RETRY_DELAY)
+
+    return min(2**attempt, MAX_RETRY_DELAY) + random.random()
@@ -8,7 +8,9 @@ on import. Use `set_logger_level` to adjust the level at runtime.
 from __future__ import annotations
 
 import logging
+import os
 import sys
+import time
 
 
 class PrettyFormatter(logging.Formatter):
@@ -31,26 +33,69 @@ class PrettyFormatter(logging.Formatter):
         "CRITICAL": "💥",
     }
 
+    def __init__(self, use_color: bool = True) -> None:
+        super().__init__()
+        colors = self.COLORS if use_color else dict.fromkeys(self.COLORS, "")
+        # Per-level "{color}{emoji} [" / "] {level:<8} | " pieces never change,
+        # so build them once instead of on every record.
+        self._prefixes = {
+            level: (f"{color}{self.EMOJIS.get(level, '📋')} [", f"] {level:<8} | ")
+            for level, color in colors.items()
+            if level != "RESET"
+        }
+        self._reset = colors["RESET"]
+        # Records in the same second share one formatted timestamp.
+        self._last_ts_sec = -1
+        self._last_ts_str = ""
+
+    def _format_timestamp(self, created: float) -> str:
+        sec = int(created)
+        if sec != self._last_ts_sec:
+            self._last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", self.converter(created))
+            self._last_ts_sec = sec
+        return self._last_ts_str
+
     def format(self, record: logging.LogRecord) -> str:  # type: ignore[override]
-        color = self.COLORS.get(record.levelname, "")
-        reset = self.COLORS["RESET"]
-        emoji = self.EMOJIS.get(record.levelname, "📋")
+        levelname = record.levelname
+        prefixes = self._prefixes.get(levelname)
+        if prefixes is None:
+            prefixes = ("📋 [", f"] {levelname:<8} | ")
 
-        timestamp = self.formatTime(record, "%Y-%m-%d %H:%M:%S")
         message = record.getMessage()
 
         if record.exc_info:
             message += f"\n{self.formatException(record.exc_info)}"
 
-        return (
-            f"{color}{emoji} [{timestamp}] "
-            f"{record.levelname:<8} | {record.name:<20} | {message}{reset}"
+        return "".join(
+            (
+                prefixes[0],
+                self._format_timestamp(record.created),
+                prefixes[1],
+                f"{record.name:<20} | ",
+                message,
+                self._reset,
+            )
         )
 
 
 _configured: bool = False
 
 
+def _should_use_color(stream) -> bool:
+    """Decide whether ANSI colors should be emitted to `stream`.
+
+    NO_COLOR disables colors, FORCE_COLOR enables them. GitHub Actions
+    renders ANSI codes in its log viewer, so colors stay on there even
+    though stdout is not a TTY; other non-TTY outputs get plain text.
+    """
+    if os.getenv("NO_COLOR"):
+        return False
+    if os.getenv("FORCE_COLOR") or os.getenv("GITHUB_ACTIONS") == "true":
+        return True
+    isatty = getattr(stream, "isatty", None)
+    return bool(isatty and isatty())
+
+
 def _configure_root_logger(level: str = "INFO") -> None:
     """Configure the root logger once with our pretty console handler."""
     global _configured
@@ -58,7 +103,7 @@ def _configure_root_logger(level: str = "INFO") -> None:
         return
 
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(PrettyFormatter())
+    console_handler.setFormatter(PrettyFormatter(use_color=_should_use_color(sys.stdout)))
 
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level.upper(), logging.INFO))
@@ -1,4 +1,7 @@
+import asyncio
 import re
+import sys
+import weakref
 from abc import ABC, abstractmethod
 
 import httpx
@@ -7,30 +10,64 @@ from bs4 import NavigableString, Tag
 from .models import ProblemData
 
 # Block-level elements that should have newlines
-BLOCK_ELEMENTS = {
-    "p",
-    "div",
-    "br",
-    "h1",
-    "h2",
-    "h3",
-    "h4",
-    "h5",
-    "h6",
-    "ul",
-    "ol",
-    "li",
-    "blockquote",
-    "pre",
-    "hr",
-    "tr",
-}
+# Interned so membership tests can hit the identity fast path on parser tag names
+BLOCK_ELEMENTS = frozenset(
+    map(
+        sys.intern,
+        (
+            "p",
+            "div",
+            "br",
+            "h1",
+            "h2",
+            "h3",
+            "h4",
+            "h5",
+            "h6",
+            "ul",
+            "ol",
+            "li",
+            "blockquote",
+            "pre",
+            "hr",
+            "tr",
+        ),
+    )
+)
+
+# Whitespace normalization patterns, compiled once for every text node
+_WHITESPACE_RE = re.compile(r"\s+")
+_EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
+
+# Per-loop, per-scraper-class request semaphores. Created on first request so
+# they bind to the loop that uses them, and wrappers that never send requests
+# (e.g. CachedScraper) never get one.
+_loop_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[type, asyncio.Semaphore]
+] = weakref.WeakKeyDictionary()
 
 
 class BaseScraper(ABC):
+    # Max in-flight requests per platform; subclasses tighten this for strict sites
+    MAX_CONCURRENT_REQUESTS: int = 8
+
     def __init__(self, client: httpx.AsyncClient):
         self.client = client
 
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return this scraper class's semaphore for the running event loop."""
+        semaphores = _loop_semaphores.setdefault(asyncio.get_running_loop(), {})
+        cls = type(self)
+        semaphore = semaphores.get(cls)
+        if semaphore is None:
+            semaphore = semaphores[cls] = asyncio.Semaphore(cls.MAX_CONCURRENT_REQUESTS)
+        return semaphore
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request through the shared client within the platform's concurrency limit."""
+        async with self._get_semaphore():
+            return await self.client.request(method, url, **kwargs)
+
     def _table_to_markdown(self, table: Tag) -> str:
         """Convert HTML table to Markdown format."""
         rows = []
@@ -59,35 +96,60 @@ class BaseScraper(ABC):
         Extract text from HTML element with proper handling of
         inline vs block elements.
         """
-        parts = []
+        result = self._collect_text(element)
+        # Clean up excessive newlines once on the fully joined text
+        result = _EXCESS_NEWLINES_RE.sub("\n\n", result)
+        return result.strip()
+
+    def _collect_text(self, element: Tag) -> str:
+        """
+        Join the raw text of `element` without final cleanup.
+
+        Walks the tree with an explicit stack instead of recursion so deeply
+        nested problem HTML neither pays per-node frame setup nor hits the
+        recursion limit.
+        """
+        root_parts: list[str] = []
+        # (children iterator, own parts, parent parts, is block element)
+        stack = [(iter(element.children), root_parts, None, False)]
+
+        while stack:
+            children, parts, parent_parts, is_block = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if parent_parts is None:
+                    continue
+                inner_text = "".join(parts).strip()
+                if is_block:
+                    # Block elements get newlines
+                    parent_parts.append("\n" + inner_text + "\n")
+                else:
+                    parent_parts.append(inner_text)
+                continue
 
-        for child in element.children:
             if isinstance(child, NavigableString):
                 text = str(child)
                 # Normalize whitespace but preserve some spacing
-                text = re.sub(r"\s+", " ", text)
+                text = _WHITESPACE_RE.sub(" ", text)
                 parts.append(text)
             elif isinstance(child, Tag):
-                if child.name == "table":
+                name = child.name
+                if name == "table":
                     # Convert table to markdown
                     parts.append("\n\n" + self._table_to_markdown(child) + "\n\n")
-                elif child.name == "br":
+                elif name == "br":
                     parts.append("\n")
-                elif child.name in BLOCK_ELEMENTS:
-                    # Block elements get newlines
-                    inner_text = self._extract_text(child)
-                    parts.append("\n" + inner_text.strip() + "\n")
-                elif child.name == "code":
+                elif name in BLOCK_ELEMENTS:
+                    stack.append((iter(child.children), [], parts, True))
+                elif name == "code":
                     # Inline code - wrap with backticks
                     parts.append("`" + child.get_text() + "`")
                 else:
-                    # Inline elements - just extract text
-                    parts.append(self._extract_text(child))
+                    # Inline elements - just extract (stripped) text
+                    stack.append((iter(child.children), [], parts, False))
 
-        result = "".join(parts)
-        # Clean up excessive newlines
-        result = re.sub(r"\n{3,}", "\n\n", result)
-        return result.strip()
+        return "".join(root_parts)
 
     @abstractmethod
     async def get_problem(self, problem_id: str) -> ProblemData:
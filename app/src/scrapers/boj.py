@@ -1,92 +1,119 @@
 import asyncio
+import re
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
+from ..http_retry import get_retry_delay
 from .base import BaseScraper
 from .models import ProblemData, TestCase
 
+# 차단/레이트 리밋/일시적 서버 오류 응답은 다음 전략으로 재시도합니다.
+RETRYABLE_STATUS_CODES = frozenset({403, 429, 500, 502, 503, 504})
+
+# 예제 입출력 요소 id (예: sample-input-1, sample-output-1)
+_SAMPLE_ID_RE = re.compile(r"^sample-(input|output)-(\d+)$")
+
+# 문제 페이지에서 실제로 읽는 요소 id
+_PROBLEM_ELEMENT_IDS = frozenset(
+    {
+        "problem_title",
+        "problem-info",
+        "problem_description",
+        "problem_input",
+        "problem_output",
+        "problem_tags",
+    }
+)
+
+# 네비게이션/푸터/스크립트 등은 트리로 만들지 않고, 위 요소와 예제만 파싱합니다.
+_PROBLEM_STRAINER = SoupStrainer(
+    id=lambda value: value is not None
+    and (value in _PROBLEM_ELEMENT_IDS or value.startswith("sample-"))
+)
+
+
+# 전략 1: 기본 브라우저 헤더
+_HEADERS_BASIC = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+# 전략 2: Client Hints 포함 헤더
+_HEADERS_CLIENT_HINTS = {
+    **_HEADERS_BASIC,
+    "Sec-CH-UA": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
+    "Sec-CH-UA-Mobile": "?0",
+    "Sec-CH-UA-Platform": '"Windows"',
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Upgrade-Insecure-Requests": "1",
+    "Cache-Control": "max-age=0",
+}
+
+# fallback 전략: (이름, 문제 URL 뒤에 붙일 접미사, 헤더)
+# 전략 3: URL 변형 + 동일 헤더
+_FETCH_STRATEGIES: tuple[tuple[str, str, dict[str, str]], ...] = (
+    ("기본 헤더", "", _HEADERS_BASIC),
+    ("Client Hints", "", _HEADERS_CLIENT_HINTS),
+    ("URL 변형 (슬래시)", "/", _HEADERS_CLIENT_HINTS),  # 끝 슬래시 추가
+    ("URL 변형 (view=standard)", "?view=standard", _HEADERS_CLIENT_HINTS),
+)
+
 
 class BOJScraper(BaseScraper):
     BASE_URL = "https://www.acmicpc.net/problem"
+    # BOJ는 짧은 시간에 요청이 몰리면 403으로 차단하므로 동시 요청을 적게 유지합니다.
+    MAX_CONCURRENT_REQUESTS = 2
+
+    # 마지막으로 성공한 fallback 전략 인덱스 (프로세스 내 모든 BOJ 요청이 공유)
+    # 기본 헤더가 403으로 막힌 환경이면 다음 문제부터는 성공한 전략을 먼저 시도합니다.
+    _preferred_strategy: int = 0
 
-    async def _fetch_with_fallback(self, problem_id: str) -> httpx.Response:
+    async def _fetch_with_fallback(self, base_url: str) -> httpx.Response:
         """
         최대 3번의 fallback 전략으로 BOJ 페이지를 가져옵니다.
-        1) HTTP/1.1 + 기본 브라우저 헤더
-        2) HTTP/2 + Client Hints 포함 헤더
+        모든 요청은 공유 클라이언트(HTTP/2 커넥션 풀)를 재사용합니다.
+        1) 기본 브라우저 헤더
+        2) Client Hints 포함 헤더
         3) URL 변형: 끝 슬래시 추가, view=standard
         4) 그래도 실패 시 403 그대로 전달
         """
-        base_url = f"{self.BASE_URL}/{problem_id}"
-
-        # 전략 1: HTTP/1.1 + 기본 브라우저 헤더
-        headers_v1 = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-        }
-
-        # 전략 2: HTTP/2 + Client Hints 포함 헤더
-        headers_v2 = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-            "Sec-CH-UA": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
-            "Sec-CH-UA-Mobile": "?0",
-            "Sec-CH-UA-Platform": '"Windows"',
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Upgrade-Insecure-Requests": "1",
-            "Cache-Control": "max-age=0",
-        }
-
-        # 전략 3: URL 변형 + 동일 헤더
-        url_variations = [
-            f"{base_url}/",  # 끝 슬래시 추가
-            f"{base_url}?view=standard",  # view=standard 파라미터
-        ]
+        last_response = None
 
-        strategies = [
-            ("HTTP/1.1", base_url, headers_v1, False),
-            ("HTTP/2 + Client Hints", base_url, headers_v2, True),
-            ("URL 변형 (슬래시)", url_variations[0], headers_v2, True),
-            ("URL 변형 (view=standard)", url_variations[1], headers_v2, True),
+        preferred = BOJScraper._preferred_strategy
+        order = [preferred] + [
+            i for i in range(len(_FETCH_STRATEGIES)) if i != preferred
         ]
 
-        last_response = None
-        retry_delays = [0, 3.0, 5.0, 10.0]
+        for attempt, strategy_index in enumerate(order):
+            _, url_suffix, headers = _FETCH_STRATEGIES[strategy_index]
+            # URL 변형은 해당 전략을 실제로 시도할 때만 만듭니다.
+            url = base_url + url_suffix if url_suffix else base_url
+            # 재시도 전 딜레이 (첫 시도 제외)
+            if attempt > 0:
+                await asyncio.sleep(get_retry_delay(last_response, attempt))
 
-        for i, (strategy_name, url, headers, use_http2) in enumerate(strategies):
             try:
-                # 재시도 전 딜레이 (첫 시도 제외)
-                if retry_delays[i] > 0:
-                    await asyncio.sleep(retry_delays[i])
-
-                if use_http2:
-                    # HTTP/2 클라이언트 생성
-                    async with httpx.AsyncClient(http2=True, timeout=30.0) as h2_client:
-                        response = await h2_client.get(url, headers=headers)
-                else:
-                    response = await self.client.get(url, headers=headers)
-
-                if response.status_code == 200:
-                    return response
-
-                last_response = response
-
-                # 403이 아닌 다른 에러는 바로 raise
-                if response.status_code != 403:
-                    response.raise_for_status()
-
-            except httpx.HTTPStatusError:
-                raise
-            except Exception:
-                # 네트워크 에러 등은 다음 전략으로 계속
+                # 전략마다 새 클라이언트를 만들지 않고 기존 커넥션(TLS 세션)을 재사용합니다.
+                response = await self._request("GET", url, headers=headers)
+            except httpx.TransportError:
+                # 연결/타임아웃 등 네트워크 에러는 다음 전략으로 계속
                 continue
 
+            if response.status_code == 200:
+                BOJScraper._preferred_strategy = strategy_index
+                return response
+
+            last_response = response
+
+            # 재시도해도 소용없는 에러(404 등)는 바로 raise
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                response.raise_for_status()
+
         # 모든 전략 실패 시 마지막 응답으로 raise
         if last_response is not None:
             last_response.raise_for_status()
@@ -100,54 +127,61 @@ class BOJScraper(BaseScraper):
     async def get_problem(self, problem_id: str) -> ProblemData:
         target_url = f"{self.BASE_URL}/{problem_id}"
 
-        response = await self._fetch_with_fallback(problem_id)
+        response = await self._fetch_with_fallback(target_url)
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        # lxml(libxml2) 파서는 순수 파이썬 html.parser보다 트리 생성이 훨씬 빠릅니다.
+        # 디코딩된 str 대신 원본 bytes를 넘겨 파이썬 측 디코딩 복사를 건너뜁니다.
+        soup = BeautifulSoup(
+            response.content,
+            "lxml",
+            parse_only=_PROBLEM_STRAINER,
+            from_encoding=response.charset_encoding,
+        )
 
         # Title
-        title_elem = soup.select_one("#problem_title")
+        title_elem = soup.find(id="problem_title")
         if not title_elem:
             raise ValueError("백준 문제 페이지를 파싱할 수 없습니다.")
         title = title_elem.get_text(strip=True)
 
         # Problem Info Table
-        info_table = soup.select_one("#problem-info")
+        info_table = soup.find(id="problem-info")
         time_limit = "N/A"
         memory_limit = "N/A"
 
         if info_table:
-            tds = info_table.select("td")
+            # 시간/메모리 제한은 첫 두 칸뿐이므로 나머지 칸은 찾지 않습니다.
+            tds = info_table.find_all("td", limit=2)
             if len(tds) >= 2:
                 time_limit = tds[0].get_text(strip=True)
                 memory_limit = tds[1].get_text(strip=True)
 
         # Description & IO
-        desc_elem = soup.select_one("#problem_description")
-        input_elem = soup.select_one("#problem_input")
-        output_elem = soup.select_one("#problem_output")
+        desc_elem = soup.find(id="problem_description")
+        input_elem = soup.find(id="problem_input")
+        output_elem = soup.find(id="problem_output")
 
         description = desc_elem.get_text(strip=True) if desc_elem else ""
         input_desc = input_elem.get_text(strip=True) if input_elem else ""
         output_desc = output_elem.get_text(strip=True) if output_elem else ""
 
         # Test Cases
-        test_cases = []
-        idx = 1
-        while True:
-            input_node = soup.select_one(f"#sample-input-{idx}")
-            output_node = soup.select_one(f"#sample-output-{idx}")
-
-            if not input_node or not output_node:
-                break
-
-            test_cases.append(
-                TestCase(input=input_node.get_text(), output=output_node.get_text())
-            )
-            idx += 1
+        # 예제 입력/출력을 번호마다 다시 찾지 않고 한 번의 트리 순회로 모두 모읍니다.
+        # 예제는 항상 <pre> 요소이므로 다른 태그는 id 검사조차 하지 않습니다.
+        samples: dict[str, dict[int, str]] = {"input": {}, "output": {}}
+        for node in soup.find_all("pre", id=_SAMPLE_ID_RE):
+            kind, idx = _SAMPLE_ID_RE.match(node["id"]).groups()
+            samples[kind].setdefault(int(idx), node.get_text())
+
+        inputs, outputs = samples["input"], samples["output"]
+        test_cases = [
+            TestCase(input=inputs[idx], output=outputs[idx])
+            for idx in sorted(inputs.keys() & outputs.keys())
+        ]
 
         # Tags
         tags = []
-        tags_div = soup.select_one("#problem_tags")
+        tags_div = soup.find(id="problem_tags")
         if tags_div:
             for tag_link in tags_div.select("li a"):
                 tags.append(tag_link.get_text(strip=True))
@@ -0,0 +1,76 @@
+import hashlib
+import os
+import time
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from .base import BaseScraper
+from .models import ProblemData
+
+# 문제 정보 디스크 캐시 디렉토리 (설정하지 않으면 캐시를 사용하지 않습니다)
+# 셀프 호스티드 러너나 actions/cache로 디렉토리를 유지하면 같은 문제를 다시 스크래핑하지 않습니다.
+PROBLEM_CACHE_DIR_ENV = "PROBLEM_CACHE_DIR"
+
+# 캐시 유효 기간 (문제 본문은 거의 바뀌지 않지만, 수정/태그 변경을 언젠가는 반영합니다)
+PROBLEM_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def get_cache_dir() -> Path | None:
+    cache_dir = os.getenv(PROBLEM_CACHE_DIR_ENV)
+    return Path(cache_dir) if cache_dir else None
+
+
+def _cache_path(cache_dir: Path, platform: str, problem_id: str) -> Path:
+    digest = hashlib.sha256(f"{platform}:{problem_id}".encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{digest}.json"
+
+
+def load_cached_problem(platform: str, problem_id: str) -> ProblemData | None:
+    """캐시된 문제 정보를 반환합니다. 캐시가 없거나 만료됐거나 읽을 수 없으면 None을 반환합니다."""
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+
+    path = _cache_path(cache_dir, platform, problem_id)
+    try:
+        if time.time() - path.stat().st_mtime > PROBLEM_CACHE_TTL_SECONDS:
+            return None
+        return ProblemData.model_validate_json(path.read_bytes())
+    except (OSError, ValidationError):
+        return None
+
+
+def save_cached_problem(platform: str, problem_id: str, problem: ProblemData) -> None:
+    """문제 정보를 캐시에 저장합니다. 저장에 실패해도 리뷰는 계속 진행합니다."""
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return
+
+    path = _cache_path(cache_dir, platform, problem_id)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(problem.model_dump_json(), encoding="utf-8")
+        # 동시에 실행된 다른 프로세스가 쓰다 만 파일을 읽지 않도록 원자적으로 교체합니다.
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+class CachedScraper(BaseScraper):
+    """다른 스크래퍼를 감싸 디스크 캐시를 먼저 확인하는 스크래퍼입니다."""
+
+    def __init__(self, platform: str, scraper: BaseScraper):
+        super().__init__(scraper.client)
+        self.platform = platform
+        self.scraper = scraper
+
+    async def get_problem(self, problem_id: str) -> ProblemData:
+        cached = load_cached_problem(self.platform, problem_id)
+        if cached is not None:
+            return cached
+
+        problem = await self.scraper.get_problem(problem_id)
+        save_cached_problem(self.platform, problem_id, problem)
+        return problem
@@ -2,16 +2,26 @@ import httpx
 
 from .base import BaseScraper
 from .boj import BOJScraper
+from .cache import CachedScraper, get_cache_dir
 from .leetcode import LeetCodeScraper
 from .programmers import ProgrammersScraper
 
+# 플랫폼 이름 -> 스크래퍼 클래스
+# 새 플랫폼은 여기에 항목 하나만 추가하면 됩니다.
+SCRAPER_REGISTRY: dict[str, type[BaseScraper]] = {
+    "BOJ": BOJScraper,
+    "LeetCode": LeetCodeScraper,
+    "Programmers": ProgrammersScraper,
+}
+
 
 def get_scraper(platform: str, client: httpx.AsyncClient) -> BaseScraper:
-    if platform == "BOJ":
-        return BOJScraper(client)
-    elif platform == "LeetCode":
-        return LeetCodeScraper(client)
-    elif platform == "Programmers":
-        return ProgrammersScraper(client)
-    else:
+    scraper_cls = SCRAPER_REGISTRY.get(platform)
+    if scraper_cls is None:
         raise ValueError(f"Unsupported platform: {platform}")
+
+    scraper = scraper_cls(client)
+    # PROBLEM_CACHE_DIR가 설정된 경우에만 디스크 캐시로 감쌉니다.
+    if get_cache_dir() is not None:
+        return CachedScraper(platform, scraper)
+    return scraper
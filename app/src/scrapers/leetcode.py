@@ -1,49 +1,55 @@
 import json
+import re
 
 from bs4 import BeautifulSoup
 
 from .base import BaseScraper
 from .models import ProblemData, TestCase
 
+# Example <pre> block: "Input: ... Output: ... [Explanation: ...]"
+_EXAMPLE_RE = re.compile(
+    r"Input:\s*(.*?)\s*Output:\s*(.*?)(?:Explanation:.*)?\Z", re.DOTALL
+)
+
 
 class LeetCodeScraper(BaseScraper):
     BASE_URL = "https://leetcode.com/problems"
     GRAPHQL_URL = "https://leetcode.com/graphql"
 
+    # Query and static headers are shared across calls; only variables/Referer vary.
+    _QUERY = """
+    query getQuestionDetail($titleSlug: String!) {
+      question(titleSlug: $titleSlug) {
+        questionId
+        title
+        content
+        difficulty
+        topicTags {
+          name
+        }
+        sampleTestCase
+        metaData
+      }
+    }
+    """
+
+    _HEADERS = {
+        "Content-Type": "application/json",
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    }
+
     async def get_problem(self, problem_id: str) -> ProblemData:
         # problem_id here is expected to be the titleSlug (e.g., "two-sum")
 
-        query = """
-        query getQuestionDetail($titleSlug: String!) {
-          question(titleSlug: $titleSlug) {
-            questionId
-            title
-            content
-            difficulty
-            topicTags {
-              name
-            }
-            sampleTestCase
-            metaData
-          }
-        }
-        """
-
-        variables = {"titleSlug": problem_id}
         payload = {
-            "query": query,
-            "variables": variables,
+            "query": self._QUERY,
+            "variables": {"titleSlug": problem_id},
             "operationName": "getQuestionDetail",
         }
+        headers = {**self._HEADERS, "Referer": f"{self.BASE_URL}/{problem_id}/"}
 
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Referer": f"{self.BASE_URL}/{problem_id}/",
-        }
-
-        response = await self.client.post(
-            self.GRAPHQL_URL, json=payload, headers=headers
+        response = await self._request(
+            "POST", self.GRAPHQL_URL, json=payload, headers=headers
         )
         response.raise_for_status()
 
@@ -56,7 +62,7 @@ class LeetCodeScraper(BaseScraper):
             raise ValueError(f"Problem not found: {problem_id}")
 
         # Parse content with proper text extraction
-        soup = BeautifulSoup(question["content"], "html.parser")
+        soup = BeautifulSoup(question["content"], "lxml")
         description = self._extract_text(soup)
 
         # Extract test cases from content (Example sections)
@@ -75,17 +81,11 @@ class LeetCodeScraper(BaseScraper):
         # Let's try to find <pre> tags
         pre_blocks = soup.find_all("pre")
         for pre in pre_blocks:
-            text = pre.get_text()
-            if "Input:" in text and "Output:" in text:
-                # Simple parsing
-                try:
-                    input_part = text.split("Input:")[1].split("Output:")[0].strip()
-                    output_part = (
-                        text.split("Output:")[1].split("Explanation:")[0].strip()
-                    )  # Remove Explanation if present
-                    test_cases.append(TestCase(input=input_part, output=output_part))
-                except:
-                    pass
+            match = _EXAMPLE_RE.search(pre.get_text())
+            if match:
+                test_cases.append(
+                    TestCase(input=match.group(1), output=match.group(2).strip())
+                )
 
         # Metadata
         meta = json.loads(question.get("metaData", "{}"))
@@ -1,14 +1,19 @@
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class TestCase(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     input: str
     output: str
 
 
 class ProblemData(BaseModel):
+    # Scraped data is never mutated after construction; unknown fields are rejected.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     # Metadata
     platform: str
     problem_id: str
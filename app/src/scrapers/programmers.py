@@ -6,6 +6,7 @@ from .models import ProblemData, TestCase
 
 class ProgrammersScraper(BaseScraper):
     BASE_URL = "https://school.programmers.co.kr/learn/courses/30/lessons"
+    MAX_CONCURRENT_REQUESTS = 4
 
     async def get_problem(self, problem_id: str) -> ProblemData:
         url = f"{self.BASE_URL}/{problem_id}"
@@ -13,10 +14,13 @@ class ProgrammersScraper(BaseScraper):
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         }
 
-        response = await self.client.get(url, headers=headers)
+        response = await self._request("GET", url, headers=headers)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        # 디코딩된 str 대신 원본 bytes를 넘겨 lxml이 직접 디코딩하도록 합니다.
+        soup = BeautifulSoup(
+            response.content, "lxml", from_encoding=response.charset_encoding
+        )
 
         # Title usually in a meta tag or li.algorithm-title which might be dynamic.
         # Fallback to page title
@@ -24,9 +28,9 @@ class ProgrammersScraper(BaseScraper):
         title = page_title.split("|")[0].strip()
 
         # Content container
-        content_div = soup.select_one(".guide-section-description")
+        content_div = soup.find(class_="guide-section-description")
         if not content_div:
-            content_div = soup.select_one("#tour-main-step")
+            content_div = soup.find(id="tour-main-step")
 
         description = ""
         test_cases = []
@@ -36,17 +40,22 @@ class ProgrammersScraper(BaseScraper):
             description = self._extract_text(content_div)
 
             # Extracting Test Cases from Table
-            tables = content_div.select("table")
+            tables = content_div.find_all("table")
             if tables:
                 # The last table is OFTEN the IO example.
                 io_table = tables[-1]
-                table_headers = [
-                    th.get_text(strip=True) for th in io_table.select("thead th")
-                ]
+                # CSS 선택자 대신 find/find_all로 태그를 직접 찾아 선택자 파싱 비용을 없앱니다.
+                thead = io_table.find("thead")
+                table_headers = (
+                    [th.get_text(strip=True) for th in thead.find_all("th")]
+                    if thead
+                    else []
+                )
 
-                rows = io_table.select("tbody tr")
+                tbody = io_table.find("tbody")
+                rows = tbody.find_all("tr") if tbody else []
                 for row in rows:
-                    cols = [td.get_text(strip=True) for td in row.select("td")]
+                    cols = [td.get_text(strip=True) for td in row.find_all("td")]
                     if len(cols) >= 2:
                         inp = ", ".join(
                             f"{h}={v}" for h, v in zip(table_headers[:-1], cols[:-1])
@@ -1,9 +1,47 @@
 import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 
+_ASCII_DIGITS = frozenset("0123456789")
 
-@dataclass
+# LeetCode 문제 slug (다음 "/", 공백, 쿼리스트링/프래그먼트 전까지)
+# 길이 상한을 두어 긴 줄에서도 slug 탐색이 짧게 끝나도록 하고,
+# 상한을 넘는 slug는 앞부분만 잘라 잘못된 ID로 쓰지 않도록 매칭하지 않습니다.
+_LEETCODE_SLUG_RE = re.compile(r"[^/\s?#]{1,128}(?=[/\s?#]|$)")
+
+# 문제 URL을 먼저 찾아볼 파일 앞부분의 길이
+_SCAN_WINDOW = 4096
+
+# (플랫폼, URL 고정 부분, 고정 부분 뒤의 ID 패턴)
+# 고정 부분은 str.find(C 수준 탐색)로 찾습니다.
+# ID 패턴이 None이면 숫자 ID이므로 정규식 없이 직접 읽습니다.
+_PROBLEM_URL_PATTERNS: tuple[tuple[str, str, re.Pattern[str] | None], ...] = (
+    # BOJ: https://www.acmicpc.net/problem/1234
+    ("BOJ", "acmicpc.net/problem/", None),
+    # LeetCode: https://leetcode.com/problems/two-sum/
+    ("LeetCode", "leetcode.com/problems/", _LEETCODE_SLUG_RE),
+    # Programmers: https://school.programmers.co.kr/learn/courses/30/lessons/12345
+    ("Programmers", "school.programmers.co.kr/learn/courses/30/lessons/", None),
+)
+
+# solved.ac README 형식 패턴
+# 제목: # [난이도] 문제명 - 번호
+_README_TITLE_RE = re.compile(r"^#\s+\[([^\]]+)\]\s+(.+?)\s*-\s*(\d+)\s*$")
+_README_URL_RE = re.compile(r"\[문제 링크\]\((https?://[^\)]+)\)")
+# 필요한 섹션(### 이름 ~ 다음 ### 전까지)을 README 한 번만 훑어 모두 찾습니다.
+_README_SECTIONS_RE = re.compile(
+    r"###\s+(문제 설명|입력|출력|분류)\s*\n(.*?)(?=###\s+|\Z)", re.DOTALL
+)
+
+
+class ProblemRef(NamedTuple):
+    """소스 코드에서 찾은 문제 참조 (플랫폼 이름, 문제 ID)"""
+
+    platform: str
+    problem_id: str
+
+
+@dataclass(slots=True)
 class ReadmeProblemInfo:
     """README.md에서 파싱한 문제 정보"""
 
@@ -35,11 +73,11 @@ def parse_readme_as_problem(readme_content: str) -> ReadmeProblemInfo | None:
     if not readme_content or not readme_content.strip():
         return None
 
-    lines = readme_content.strip().split("\n")
+    # 제목은 첫 줄만 필요하므로 전체를 줄 단위 리스트로 나누지 않습니다.
+    first_line = readme_content.lstrip().partition("\n")[0].strip()
 
     # 제목 파싱: # [난이도] 문제명 - 번호
-    title_pattern = r"^#\s+\[([^\]]+)\]\s+(.+?)\s*-\s*(\d+)\s*$"
-    title_match = re.match(title_pattern, lines[0].strip())
+    title_match = _README_TITLE_RE.match(first_line)
     if not title_match:
         return None
 
@@ -49,25 +87,20 @@ def parse_readme_as_problem(readme_content: str) -> ReadmeProblemInfo | None:
     title = f"{problem_name} - {problem_id}"
 
     # URL 파싱
-    url_pattern = r"\[문제 링크\]\((https?://[^\)]+)\)"
-    url_match = re.search(url_pattern, readme_content)
+    url_match = _README_URL_RE.search(readme_content)
     url = url_match.group(1) if url_match else ""
 
-    # 섹션 추출 헬퍼 함수
-    def extract_section(section_name: str) -> str:
-        pattern = rf"###\s+{re.escape(section_name)}\s*\n(.*?)(?=###\s+|\Z)"
-        match = re.search(pattern, readme_content, re.DOTALL)
-        if match:
-            return match.group(1).strip()
-        return ""
+    # 섹션 추출 (같은 섹션이 여러 번 나오면 첫 번째를 사용)
+    sections: dict[str, str] = {}
+    for match in _README_SECTIONS_RE.finditer(readme_content):
+        sections.setdefault(match.group(1), match.group(2).strip())
 
-    # 각 섹션 추출
-    description = extract_section("문제 설명")
-    input_desc = extract_section("입력")
-    output_desc = extract_section("출력")
+    description = sections.get("문제 설명", "")
+    input_desc = sections.get("입력", "")
+    output_desc = sections.get("출력", "")
 
     # 분류(태그) 추출
-    tags_section = extract_section("분류")
+    tags_section = sections.get("분류", "")
     tags = [tag.strip() for tag in tags_section.split(",") if tag.strip()] if tags_section else []
     # 줄바꿈으로 구분된 경우도 처리
     if not tags and tags_section:
@@ -88,28 +121,54 @@ def parse_readme_as_problem(readme_content: str) -> ReadmeProblemInfo | None:
     )
 
 
-def parse_problem_url(content: str) -> Optional[tuple[str, str]]:
+def _scan_digits(content: str, start: int) -> int:
+    """start부터 이어지는 ASCII 숫자의 끝 위치를 반환합니다."""
+    end = start
+    length = len(content)
+    while end < length and content[end] in _ASCII_DIGITS:
+        end += 1
+    return end
+
+
+def _scan_problem_id(
+    content: str, start: int, id_pattern: re.Pattern[str] | None
+) -> int:
+    """start부터 시작하는 문제 ID의 끝 위치를 반환합니다. ID가 없으면 start를 반환합니다."""
+    if id_pattern is None:
+        return _scan_digits(content, start)
+    match = id_pattern.match(content, start)
+    return match.end() if match else start
+
+
+def _find_problem_url(content: str, limit: int) -> Optional[ProblemRef]:
+    """content[:limit] 안에서 시작하는 URL 중 가장 먼저 나온 것을 찾습니다."""
+    found: Optional[ProblemRef] = None
+    found_pos = -1
+    for platform, prefix, id_pattern in _PROBLEM_URL_PATTERNS:
+        # 슬라이스를 만들지 않고 str.find의 end 인자로 검사 범위를 제한합니다.
+        pos = content.find(prefix, 0, limit)
+        while pos >= 0 and (found is None or pos < found_pos):
+            start = pos + len(prefix)
+            # ID는 검사 범위를 넘어가더라도 끝까지 읽습니다.
+            end = _scan_problem_id(content, start, id_pattern)
+            if end > start:
+                found = ProblemRef(platform, content[start:end])
+                found_pos = pos
+                break
+            # ID가 없는 URL은 건너뛰고 다음 위치를 찾습니다.
+            pos = content.find(prefix, start, limit)
+
+    return found
+
+
+def parse_problem_url(content: str) -> Optional[ProblemRef]:
     """
     Extracts the problem platform and ID/URL from the given content (usually source code).
-    Returns a tuple of (platform_name, problem_id).
+    Returns a ProblemRef tuple of (platform, problem_id).
     """
-
-    # BOJ: https://www.acmicpc.net/problem/1234
-    boj_pattern = r"acmicpc\.net/problem/(\d+)"
-    match = re.search(boj_pattern, content)
-    if match:
-        return "BOJ", match.group(1)
-
-    # LeetCode: https://leetcode.com/problems/two-sum/
-    leetcode_pattern = r"leetcode\.com/problems/([^/]+)"
-    match = re.search(leetcode_pattern, content)
-    if match:
-        return "LeetCode", match.group(1)
-
-    # Programmers: https://school.programmers.co.kr/learn/courses/30/lessons/12345
-    programmers_pattern = r"school\.programmers\.co\.kr/learn/courses/30/lessons/(\d+)"
-    match = re.search(programmers_pattern, content)
-    if match:
-        return "Programmers", match.group(1)
-
-    return None
+    # 문제 URL은 대부분 파일 상단 주석에 있으므로 앞부분만 먼저 검사합니다.
+    # 찾으면 큰 파일에서 다른 플랫폼의 URL을 찾느라 전체를 훑지 않아도 됩니다.
+    problem = _find_problem_url(content, _SCAN_WINDOW)
+    if problem is None and len(content) > _SCAN_WINDOW:
+        problem = _find_problem_url(content, len(content))
+    return problem
@@ -0,0 +1,32 @@
+import unittest
+
+from bs4 import BeautifulSoup
+
+from src.scrapers.boj import BOJScraper
+
+
+class ExtractTextTest(unittest.TestCase):
+    def setUp(self):
+        self.scraper = BOJScraper(None)
+
+    def extract(self, html: str) -> str:
+        return self.scraper._extract_text(BeautifulSoup(html, "lxml").div)
+
+    def test_inline_children_are_stripped(self):
+        self.assertEqual(self.extract("<div><span>a </span><span>b</span></div>"), "ab")
+        self.assertEqual(
+            self.extract("<div><p>Hello <b>  world  </b>!</p><p>x<i> y </i>z</p></div>"),
+            "Hello world!\n\nxyz",
+        )
+
+    def test_mixed_inline_and_block_markup(self):
+        html = (
+            "<div>A<div>B <em> c </em></div>"
+            "<ul><li>one <code>x  y</code></li><li><strong> two </strong></li></ul>"
+            "tail</div>"
+        )
+        self.assertEqual(self.extract(html), "A\nB c\n\none `x  y`\n\ntwo\ntail")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+from src.utils import parse_problem_url
+
+
+class ParseProblemUrlTest(unittest.TestCase):
+    def test_leetcode_slug(self):
+        for content in (
+            "// https://leetcode.com/problems/two-sum/",
+            "# https://leetcode.com/problems/two-sum\nclass Solution:",
+            "// https://leetcode.com/problems/two-sum?envType=daily-question",
+            "// https://leetcode.com/problems/two-sum#description",
+            "https://leetcode.com/problems/two-sum",
+        ):
+            self.assertEqual(parse_problem_url(content), ("LeetCode", "two-sum"))
+
+    def test_leetcode_slug_at_length_limit(self):
+        slug = "a" * 128
+        content = f"// https://leetcode.com/problems/{slug}/"
+        self.assertEqual(parse_problem_url(content), ("LeetCode", slug))
+
+    def test_leetcode_slug_too_long_is_rejected(self):
+        content = "// https://leetcode.com/problems/" + "a" * 129 + "/\nclass Solution:"
+        self.assertIsNone(parse_problem_url(content))
+
+    def test_too_long_slug_falls_through_to_later_url(self):
+        content = (
+            "// https://leetcode.com/problems/" + "a" * 200 + "\n"
+            "// https://www.acmicpc.net/problem/1000\n"
+        )
+        self.assertEqual(parse_problem_url(content), ("BOJ", "1000"))
+
+    def test_earliest_url_wins_across_judges(self):
+        boj_first = (
+            "# https://www.acmicpc.net/problem/1000\n"
+            "# https://leetcode.com/problems/two-sum/\n"
+        )
+        self.assertEqual(parse_problem_url(boj_first), ("BOJ", "1000"))
+
+        leetcode_first = (
+            "// https://leetcode.com/problems/two-sum/\n"
+            "// 비슷한 문제: https://www.acmicpc.net/problem/1000\n"
+        )
+        self.assertEqual(parse_problem_url(leetcode_first), ("LeetCode", "two-sum"))
+
+        programmers_first = (
+            "// https://school.programmers.co.kr/learn/courses/30/lessons/12345\n"
+            "// https://www.acmicpc.net/problem/1000\n"
+        )
+        self.assertEqual(
+            parse_problem_url(programmers_first), ("Programmers", "12345")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()